@@ -33,14 +33,30 @@ Date: 2026-01-27
 """
 
 import pandas as pd
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 import re
 
+# Optional imports (graceful degradation)
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+try:
+    from tqdm.auto import tqdm
+    HAS_TQDM = True
+except ImportError:
+    HAS_TQDM = False
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -50,6 +66,18 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_RAW = PROJECT_ROOT / "data_raw"
 DATA_CLEAN = PROJECT_ROOT / "data_clean"
 
+# Shared HTTP session for structure lookups: keep-alive connection pool plus
+# retries on transient gateway errors
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
+# (connect, read) timeouts in seconds for lookup requests
+LOOKUP_TIMEOUT = (3, 7)
+
 
 # =============================================================================
 # ANNOTATION LOOKUP TABLES
@@ -236,6 +264,49 @@ FAMILY_ANNOTATIONS = {
     },
 }
 
+# Columns added to the hit list by the annotation step
+ANNOTATION_COLS = [
+    "inferred_family", "capsid_role", "architecture_class",
+    "virion_morphology", "t_number", "genome_type", "jrf_orientation",
+    "structure_id", "structure_source", "realm", "host_category"
+]
+
+# Internal helper columns, never written to the output tables
+SCRATCH_COLS = ["_has_structure"]
+
+# pandas' default read_csv missing-value markers, so the Polars scan treats
+# the same cells as missing
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+# Text columns of the cleaned hit list read by the annotation step
+TEXT_INPUT_COLS = [
+    "uniprot_id", "protein_name", "organism", "family",
+    "pfam_jrf_class", "pfam_capsid_role"
+]
+
+# Evidence rule vocabularies
+HIGH_CONF_ROLES = ["MCP", "minor", "spike", "turret", "cement"]
+HIGH_CONF_ARCHS = ["SJR", "DJR", "tandem_JRF"]
+
+# Annotation columns carried by each FAMILY_ANNOTATIONS entry
+_FAM_COLS = (
+    "architecture_class",
+    "virion_morphology",
+    "t_number",
+    "genome_type",
+    "jrf_orientation",
+)
+
+# Family -> annotation values in _FAM_COLS order
+_FAM_LOOKUP = {
+    family: tuple(annot[col] for col in _FAM_COLS)
+    for family, annot in FAMILY_ANNOTATIONS.items()
+}
+
 # Protein name patterns for role classification
 ROLE_PATTERNS = {
     "MCP": [
@@ -274,6 +345,58 @@ ROLE_PATTERNS = {
     ],
 }
 
+# Declared vocabularies of the low-cardinality annotation columns, stored as
+# categoricals (observed values outside these are appended as extra categories)
+CATEGORY_VOCAB = {
+    "inferred_family": sorted(FAMILY_ANNOTATIONS) + [""],
+    **{
+        col: sorted({annot[col] for annot in FAMILY_ANNOTATIONS.values()} - {""}) + [""]
+        for col in _FAM_COLS
+    },
+    "capsid_role": list(ROLE_PATTERNS) + ["unknown", ""],
+    "structure_source": ["experimental", "AlphaFold", ""],
+    "evidence_level": ["high", "medium", "low"],
+}
+
+# Organism name patterns for family inference
+FAMILY_PATTERNS = {
+    "Parvoviridae": [r"parvovirus", r"aav", r"adeno-associated", r"bocavirus", r"dependovirus"],
+    "Picornaviridae": [r"picornavirus", r"poliovirus", r"rhinovirus", r"enterovirus", r"coxsackie", r"hepatitis a"],
+    "Adenoviridae": [r"adenovirus"],
+    "Circoviridae": [r"circovirus", r"pcv2?", r"bfdv"],
+    "Geminiviridae": [r"geminivirus", r"begomovirus", r"mastrevirus"],
+    "Nodaviridae": [r"nodavirus", r"flock house", r"nodamura"],
+    "Tombusviridae": [r"tombusvirus", r"carmovirus", r"necrovirus"],
+    "Bromoviridae": [r"bromovirus", r"ccmv", r"alfamovirus"],
+    "Phycodnaviridae": [r"chlorella virus", r"phycodnavirus", r"pbcv"],
+    "Asfarviridae": [r"african swine fever", r"asfv"],
+    "Tectiviridae": [r"prd1", r"tectivirus"],
+    "Iridoviridae": [r"iridovirus", r"ranavirus"],
+    "Mimiviridae": [r"mimivirus", r"megavirus"],
+    "Birnaviridae": [r"birnavirus", r"ibdv", r"ipnv"],
+}
+
+# Compiled once at import so the per-row matching skips the re module cache
+ROLE_PATTERNS_COMPILED = {
+    role: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for role, patterns in ROLE_PATTERNS.items()
+}
+FAMILY_PATTERNS_COMPILED = {
+    family: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for family, patterns in FAMILY_PATTERNS.items()
+}
+
+# Lowercase substrings implied by ROLE_PATTERNS and the capsid/coat/shell
+# fallback; a name containing none of them can only be "unknown"
+_ROLE_KEYWORDS = (
+    "capsid", "coat", "shell", "vp", "mcp", "p72", "hexon",
+    "penton", "vertex",
+    "spike", "fiber", "receptor binding",
+    "turret",
+    "cement", "glue", "protein i",
+    "movement", "30k", "cell-to-cell",
+)
+
 
 def infer_capsid_role(protein_name: str, family: str = "") -> str:
     """
@@ -289,11 +412,14 @@ def infer_capsid_role(protein_name: str, family: str = "") -> str:
     if not protein_name:
         return "unknown"
     
+    # Fast path: skip the regex scan for names with no role keyword
     protein_name_lower = protein_name.lower()
+    if not any(k in protein_name_lower for k in _ROLE_KEYWORDS):
+        return "unknown"
     
-    for role, patterns in ROLE_PATTERNS.items():
+    for role, patterns in ROLE_PATTERNS_COMPILED.items():
         for pattern in patterns:
-            if re.search(pattern, protein_name_lower, re.IGNORECASE):
+            if pattern.search(protein_name):
                 return role
     
     # Default to MCP if it contains capsid/coat but no specific role
@@ -313,34 +439,35 @@ def infer_family_from_organism(organism: str) -> str:
     Returns:
         Inferred family or empty string
     """
-    organism_lower = organism.lower()
-    
-    # Pattern matching for common virus names
-    family_patterns = {
-        "Parvoviridae": [r"parvovirus", r"aav", r"adeno-associated", r"bocavirus", r"dependovirus"],
-        "Picornaviridae": [r"picornavirus", r"poliovirus", r"rhinovirus", r"enterovirus", r"coxsackie", r"hepatitis a"],
-        "Adenoviridae": [r"adenovirus"],
-        "Circoviridae": [r"circovirus", r"pcv2?", r"bfdv"],
-        "Geminiviridae": [r"geminivirus", r"begomovirus", r"mastrevirus"],
-        "Nodaviridae": [r"nodavirus", r"flock house", r"nodamura"],
-        "Tombusviridae": [r"tombusvirus", r"carmovirus", r"necrovirus"],
-        "Bromoviridae": [r"bromovirus", r"ccmv", r"alfamovirus"],
-        "Phycodnaviridae": [r"chlorella virus", r"phycodnavirus", r"pbcv"],
-        "Asfarviridae": [r"african swine fever", r"asfv"],
-        "Tectiviridae": [r"prd1", r"tectivirus"],
-        "Iridoviridae": [r"iridovirus", r"ranavirus"],
-        "Mimiviridae": [r"mimivirus", r"megavirus"],
-        "Birnaviridae": [r"birnavirus", r"ibdv", r"ipnv"],
-    }
-    
-    for family, patterns in family_patterns.items():
+    for family, patterns in FAMILY_PATTERNS_COMPILED.items():
         for pattern in patterns:
-            if re.search(pattern, organism_lower, re.IGNORECASE):
+            if pattern.search(organism):
                 return family
     
     return ""
 
 
+def encode_categories(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+    """
+    Convert annotation columns to pandas categoricals in place.
+    
+    Args:
+        df: Annotated DataFrame
+        cols: Columns to convert (must be keys of CATEGORY_VOCAB)
+    
+    Returns:
+        The same DataFrame
+    """
+    for col in cols:
+        if col not in df.columns:
+            continue
+        known = CATEGORY_VOCAB[col]
+        extras = sorted(v for v in df[col].unique() if pd.notna(v) and v not in known)
+        df[col] = pd.Categorical(df[col], categories=known + extras)
+    
+    return df
+
+
 def lookup_pdb_structure(uniprot_id: str) -> Tuple[str, str]:
     """
     Look up PDB structure availability for a UniProt ID.
@@ -358,7 +485,7 @@ def lookup_pdb_structure(uniprot_id: str) -> Tuple[str, str]:
     url = f"https://www.ebi.ac.uk/pdbe/api/mappings/best_structures/{uniprot_id}"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=LOOKUP_TIMEOUT)
         if response.status_code == 200:
             data = response.json()
             structures = data.get(uniprot_id, [])
@@ -377,7 +504,7 @@ def lookup_pdb_structure(uniprot_id: str) -> Tuple[str, str]:
     af_url = f"https://alphafold.ebi.ac.uk/api/prediction/{uniprot_id}"
     
     try:
-        response = requests.get(af_url, timeout=10)
+        response = _SESSION.get(af_url, timeout=LOOKUP_TIMEOUT)
         if response.status_code == 200:
             return alphafold_id, "AlphaFold"
     except:
@@ -403,17 +530,24 @@ def annotate_dataframe(df: pd.DataFrame,
     logger.info("Adding capsidomics annotations...")
     
     # Initialize new columns
-    annotation_cols = [
-        "inferred_family", "capsid_role", "architecture_class", 
-        "virion_morphology", "t_number", "genome_type", "jrf_orientation",
-        "structure_id", "structure_source", "realm", "host_category"
-    ]
-    
-    for col in annotation_cols:
+    for col in ANNOTATION_COLS:
         if col not in df.columns:
             df[col] = ""
     
-    for idx, row in df.iterrows():
+    # Missing text cells are read as NaN, which is truthy; treat them as empty
+    text_cols = [c for c in ANNOTATION_COLS + TEXT_INPUT_COLS if c in df.columns]
+    df[text_cols] = df[text_cols].fillna("")
+    
+    # Rows matched to a known family, written back in one block after the loop
+    fam_rows = []
+    fam_vals = []
+    
+    rows = df.iterrows()
+    if HAS_TQDM:
+        # Rate-limited progress bar instead of per-row log calls
+        rows = tqdm(rows, total=len(df), mininterval=1.0, desc="Annotating")
+    
+    for idx, row in rows:
         # Step 1: Infer or use existing family
         family = row.get("family", "")
         if not family:
@@ -423,10 +557,10 @@ def annotate_dataframe(df: pd.DataFrame,
             df.at[idx, "inferred_family"] = family
         
         # Step 2: Lookup family annotations
-        if family in FAMILY_ANNOTATIONS:
-            fam_annot = FAMILY_ANNOTATIONS[family]
-            for key, value in fam_annot.items():
-                df.at[idx, key] = value
+        row_vals = _FAM_LOOKUP.get(family)
+        if row_vals:
+            fam_rows.append(idx)
+            fam_vals.append(row_vals)
         else:
             # Use PFAM-based class if available
             pfam_class = row.get("pfam_jrf_class", "")
@@ -452,12 +586,18 @@ def annotate_dataframe(df: pd.DataFrame,
                 df.at[idx, "structure_id"] = pdb_id
                 df.at[idx, "structure_source"] = source
                 time.sleep(rate_limit)
-        
-        # Progress logging
-        if idx % 100 == 0:
-            logger.info(f"  Annotated {idx}/{len(df)} proteins...")
     
-    return df
+    logger.info(f"  Annotated {len(df)} proteins")
+    
+    if fam_rows:
+        df.loc[fam_rows, list(_FAM_COLS)] = fam_vals
+    
+    # Cached structure mask shared by the evidence rules and summary stats
+    df["_has_structure"] = df["structure_id"].fillna("").ne("")
+    
+    # One byte of category code per row instead of an object pointer
+    categorical_cols = [c for c in CATEGORY_VOCAB if c != "evidence_level"]
+    return encode_categories(df, categorical_cols)
 
 
 def apply_evidence_rules(df: pd.DataFrame) -> pd.DataFrame:
@@ -483,9 +623,9 @@ def apply_evidence_rules(df: pd.DataFrame) -> pd.DataFrame:
     # High confidence criteria
     high_conf_mask = (
         # Capsid role is known
-        (df["capsid_role"].isin(["MCP", "minor", "spike", "turret", "cement"])) &
+        (df["capsid_role"].isin(HIGH_CONF_ROLES)) &
         # Architecture class is known
-        (df["architecture_class"].isin(["SJR", "DJR", "tandem_JRF"])) &
+        (df["architecture_class"].isin(HIGH_CONF_ARCHS)) &
         # Reasonable length
         (df["protein_length"] >= 150) &
         (df["protein_length"] <= 2000)
@@ -503,14 +643,13 @@ def apply_evidence_rules(df: pd.DataFrame) -> pd.DataFrame:
     df.loc[low_conf_mask, "evidence_level"] = "low"
     
     # Boost to high if structure is available
-    structure_mask = df["structure_id"].notna() & (df["structure_id"] != "")
-    df.loc[structure_mask & (df["evidence_level"] == "medium"), "evidence_level"] = "high"
+    df.loc[df["_has_structure"] & (df["evidence_level"] == "medium"), "evidence_level"] = "high"
     
     logger.info(f"  High confidence: {(df['evidence_level'] == 'high').sum()}")
     logger.info(f"  Medium confidence: {(df['evidence_level'] == 'medium').sum()}")
     logger.info(f"  Low confidence: {(df['evidence_level'] == 'low').sum()}")
     
-    return df
+    return encode_categories(df, ["evidence_level"])
 
 
 def generate_master_columns_order() -> List[str]:
@@ -554,35 +693,247 @@ def generate_master_columns_order() -> List[str]:
     ]
 
 
-def reorder_and_clean_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Reorder columns and clean up the DataFrame."""
+def master_column_order(columns: List[str]) -> List[str]:
+    """Return the output column order for the given columns, without scratch columns."""
     
     preferred_order = generate_master_columns_order()
     
     # Get columns that exist in df
-    existing_cols = [c for c in preferred_order if c in df.columns]
+    existing_cols = [c for c in preferred_order if c in columns]
     
     # Add any remaining columns
-    remaining_cols = [c for c in df.columns if c not in existing_cols]
+    remaining_cols = [c for c in columns if c not in existing_cols and c not in SCRATCH_COLS]
+    
+    return existing_cols + remaining_cols
+
+
+# =============================================================================
+# POLARS FAST PATH
+# =============================================================================
+
+def _pattern_chain(text: "pl.Expr", patterns: Dict[str, List[str]]):
+    """
+    Build a first-match-wins when/then chain over case-insensitive patterns.
     
-    final_order = existing_cols + remaining_cols
+    Args:
+        text: String expression to match against
+        patterns: Label -> regex list, checked in declaration order
     
-    return df[final_order]
+    Returns:
+        Unterminated Polars when/then chain (caller adds .otherwise())
+    """
+    chain = pl
+    for label, pats in patterns.items():
+        regex = "(?i)" + "|".join(f"(?:{p})" for p in pats)
+        chain = chain.when(text.str.contains(regex)).then(pl.lit(label))
+    return chain
 
 
-def generate_summary_stats(df: pd.DataFrame) -> Dict:
-    """Generate comprehensive summary statistics."""
+def _text(lf: "pl.LazyFrame", col: str) -> "pl.Expr":
+    """Return a column as a null-free string expression, or "" if it is absent."""
+    if col in lf.collect_schema().names():
+        return pl.col(col).fill_null("")
+    return pl.lit("")
+
+
+def _add_annotation_columns(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """Initialize the annotation columns as null-free strings."""
+    return lf.with_columns([_text(lf, col).alias(col) for col in ANNOTATION_COLS])
+
+
+def _add_inferred_family(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """Use the existing family, or infer it from the organism name."""
+    family = _text(lf, "family")
+    inferred = _pattern_chain(_text(lf, "organism"), FAMILY_PATTERNS).otherwise(pl.lit(""))
+    
+    return lf.with_columns(
+        pl.when(family != "").then(family).otherwise(inferred).alias("inferred_family")
+    )
+
+
+def _add_family_annotations(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """Map family annotations, falling back to the PFAM-based class and role."""
+    known = pl.col("inferred_family").is_in(list(FAMILY_ANNOTATIONS))
+    pfam_class = _text(lf, "pfam_jrf_class")
+    pfam_role = _text(lf, "pfam_capsid_role")
+    fallbacks = {
+        "architecture_class": pl.when(pfam_class != "").then(pfam_class)
+                                .otherwise(pl.col("architecture_class")),
+    }
+    
+    return lf.with_columns(
+        [
+            pl.col("inferred_family").replace_strict(
+                {fam: annot[col] for fam, annot in FAMILY_ANNOTATIONS.items()},
+                default=fallbacks.get(col, pl.col(col)),
+                return_dtype=pl.String,
+            ).alias(col)
+            for col in _FAM_COLS
+        ]
+        + [
+            pl.when(~known & (pfam_role != "")).then(pfam_role)
+            .otherwise(pl.col("capsid_role")).alias("capsid_role")
+        ]
+    )
+
+
+def _add_capsid_role(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """Infer capsid role from protein name where it is not yet set."""
+    name = _text(lf, "protein_name")
+    inferred_role = (
+        _pattern_chain(name, ROLE_PATTERNS)
+        .when(name.str.contains("(?i)capsid|coat|shell")).then(pl.lit("MCP"))
+        .otherwise(pl.lit("unknown"))
+    )
+    
+    return lf.with_columns(
+        pl.when(pl.col("capsid_role") != "").then(pl.col("capsid_role"))
+        .otherwise(inferred_role).alias("capsid_role")
+    )
+
+
+def _add_evidence(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """Apply evidence rules (low overrides high; structures boost medium)."""
+    length = pl.col("protein_length").cast(pl.Float64, strict=False)
+    high_conf = (
+        pl.col("capsid_role").is_in(HIGH_CONF_ROLES)
+        & pl.col("architecture_class").is_in(HIGH_CONF_ARCHS)
+        & (length >= 150)
+        & (length <= 2000)
+    )
+    low_conf = (
+        (pl.col("capsid_role") == "unknown")
+        | (pl.col("architecture_class") == "")
+        | (length < 100)
+    )
+    
+    return lf.with_columns(
+        (pl.col("structure_id") != "").alias("_has_structure")
+    ).with_columns(
+        pl.when(low_conf).then(pl.lit("low"))
+        .when(high_conf | pl.col("_has_structure")).then(pl.lit("high"))
+        .otherwise(pl.lit("medium"))
+        .alias("evidence_level")
+    )
+
+
+def annotate_lazyframe(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """
+    Polars equivalent of annotate_dataframe, apply_evidence_rules and the
+    master_column_order selection as a single lazy query.
+    
+    The stages only add with_columns nodes, so the optimizer can fuse them
+    into one pass over the data. Structure lookups are not supported here;
+    they need the row-wise path. Expects every column to be read as a string
+    (infer_schema_length=0).
+    
+    Args:
+        lf: LazyFrame over the cleaned hit list
+    
+    Returns:
+        LazyFrame producing the master table (plus scratch columns)
+    """
+    lf = (
+        lf.pipe(_add_annotation_columns)
+        .pipe(_add_inferred_family)
+        .pipe(_add_family_annotations)
+        .pipe(_add_capsid_role)
+        .pipe(_add_evidence)
+    )
+    
+    # Scratch columns are kept for the summary stats
+    return lf.select(master_column_order(lf.collect_schema().names()) + SCRATCH_COLS)
+
+
+def match_pandas_numeric(df: "pl.DataFrame") -> "pl.DataFrame":
+    """
+    Render numeric columns the way pandas reads and writes them.
+    
+    The Polars path scans every column as a string, but pandas types a column
+    whose cells all parse as numbers: int64 if every cell is an integer,
+    otherwise float64 (a blank cell turns 735 into 735.0). Polars writes the
+    same shortest round-trip digits as pandas; only values with
+    1e-9 <= |x| < 1e-4 differ in notation (0.00001 vs 1e-05).
+    
+    Args:
+        df: Collected master table (all input columns as strings)
+    
+    Returns:
+        DataFrame with numeric columns cast to Int64 or Float64
+    """
+    casts = []
+    for col in df.columns:
+        values = df[col]
+        if values.dtype != pl.String or values.null_count() == len(values):
+            continue
+        
+        if values.cast(pl.Int64, strict=False).null_count() == 0:
+            casts.append(pl.col(col).cast(pl.Int64))
+        elif values.cast(pl.Float64, strict=False).null_count() == values.null_count():
+            casts.append(pl.col(col).cast(pl.Float64))
+    
+    return df.with_columns(casts)
+
+
+def write_csv_polars(df: "pl.DataFrame", path: Path):
+    """Write a Polars frame to CSV with empty strings left unquoted, as pandas does."""
+    df.drop(SCRATCH_COLS, strict=False).with_columns(pl.col(pl.String).replace("", None)).write_csv(path)
+
+
+def _category_counts(df: "Union[pd.DataFrame, pl.DataFrame]", col: str) -> Dict:
+    """
+    Count values of a column via its categorical codes.
+    
+    Ties keep first-appearance order, as plain value_counts() does. Polars
+    frames from the fast path are counted natively in the same order.
+    
+    Args:
+        df: Annotated DataFrame (pandas or Polars)
+        col: Column to count
+    
+    Returns:
+        Value -> count dict (most frequent first), empty if the column is missing
+    """
+    if col not in df.columns:
+        return {}
+    
+    if HAS_POLARS and isinstance(df, pl.DataFrame):
+        counts = (
+            df.select(pl.col(col).drop_nulls())
+            .group_by(col, maintain_order=True)
+            .len()
+            .sort("len", descending=True, maintain_order=True)
+        )
+        return dict(counts.iter_rows())
+    
+    values = df[col]
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype("category")
+    
+    codes = values.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+    
+    # Observed codes in order of first appearance, stably sorted by count
+    order = pd.unique(codes[codes >= 0])
+    order = order[np.argsort(-counts[order], kind="stable")]
+    
+    categories = values.cat.categories
+    return {categories[c]: int(counts[c]) for c in order}
+
+
+def generate_summary_stats(df: "Union[pd.DataFrame, pl.DataFrame]") -> Dict:
+    """Generate comprehensive summary statistics (pandas or Polars frame)."""
     
     stats = {
         "total_entries": len(df),
-        "by_evidence_level": df["evidence_level"].value_counts().to_dict(),
-        "by_architecture": df["architecture_class"].value_counts().to_dict() if "architecture_class" in df.columns else {},
-        "by_capsid_role": df["capsid_role"].value_counts().to_dict() if "capsid_role" in df.columns else {},
-        "by_t_number": df["t_number"].value_counts().to_dict() if "t_number" in df.columns else {},
-        "by_genome_type": df["genome_type"].value_counts().to_dict() if "genome_type" in df.columns else {},
-        "by_family": df["inferred_family"].value_counts().to_dict() if "inferred_family" in df.columns else {},
-        "by_morphology": df["virion_morphology"].value_counts().to_dict() if "virion_morphology" in df.columns else {},
-        "with_structure": len(df[df["structure_id"].notna() & (df["structure_id"] != "")]) if "structure_id" in df.columns else 0,
+        "by_evidence_level": _category_counts(df, "evidence_level"),
+        "by_architecture": _category_counts(df, "architecture_class"),
+        "by_capsid_role": _category_counts(df, "capsid_role"),
+        "by_t_number": _category_counts(df, "t_number"),
+        "by_genome_type": _category_counts(df, "genome_type"),
+        "by_family": _category_counts(df, "inferred_family"),
+        "by_morphology": _category_counts(df, "virion_morphology"),
+        "with_structure": int(df["_has_structure"].sum()) if "_has_structure" in df.columns else 0,
     }
     
     return stats
@@ -607,28 +958,51 @@ def main(lookup_structures: bool = False):
         logger.error("Please run phase3_expansion.py first")
         return
     
-    df = pd.read_csv(clean_path)
-    logger.info(f"\nLoaded {len(df)} cleaned hits")
-    
-    # Step 2: Add capsidomics annotations
-    df = annotate_dataframe(df, lookup_structures=lookup_structures)
-    
-    # Step 3: Apply evidence rules
-    df = apply_evidence_rules(df)
-    
-    # Step 4: Reorder columns
-    df = reorder_and_clean_columns(df)
-    
-    # Step 5: Save master table
     master_path = DATA_CLEAN / "jrf_capsidomics_master.csv"
-    df.to_csv(master_path, index=False)
-    logger.info(f"\nSaved master table to: {master_path}")
-    
-    # Step 6: Create high-confidence subset
-    high_conf = df[df["evidence_level"] == "high"].copy()
     high_conf_path = DATA_CLEAN / "jrf_high_confidence.csv"
-    high_conf.to_csv(high_conf_path, index=False)
-    logger.info(f"Saved high-confidence subset ({len(high_conf)} entries) to: {high_conf_path}")
+    
+    if HAS_POLARS and not lookup_structures:
+        # Steps 2-6 as one fused lazy query
+        master = (
+            annotate_lazyframe(
+                pl.scan_csv(clean_path, infer_schema_length=0, null_values=PANDAS_NA_VALUES)
+            )
+            .collect(engine="streaming")
+            .pipe(match_pandas_numeric)
+        )
+        logger.info(f"\nAnnotated {master.height} cleaned hits (Polars)")
+        
+        write_csv_polars(master, master_path)
+        logger.info(f"\nSaved master table to: {master_path}")
+        
+        high_conf = master.filter(pl.col("evidence_level") == "high")
+        write_csv_polars(high_conf, high_conf_path)
+        logger.info(f"Saved high-confidence subset ({high_conf.height} entries) to: {high_conf_path}")
+        
+        # Summary stats read the Polars frame directly
+        df = master
+    else:
+        # Correctly rounded float parsing, as in the Polars path
+        df = pd.read_csv(clean_path, float_precision="round_trip")
+        logger.info(f"\nLoaded {len(df)} cleaned hits")
+        
+        # Step 2: Add capsidomics annotations
+        df = annotate_dataframe(df, lookup_structures=lookup_structures)
+        
+        # Step 3: Apply evidence rules
+        df = apply_evidence_rules(df)
+        
+        # Step 4: Reorder columns at write time instead of copying the frame
+        final_order = master_column_order(list(df.columns))
+        
+        # Step 5: Save master table
+        df.to_csv(master_path, index=False, columns=final_order)
+        logger.info(f"\nSaved master table to: {master_path}")
+        
+        # Step 6: Create high-confidence subset
+        high_conf = df[df["evidence_level"] == "high"]
+        high_conf.to_csv(high_conf_path, index=False, columns=final_order)
+        logger.info(f"Saved high-confidence subset ({len(high_conf)} entries) to: {high_conf_path}")
     
     # Step 7: Generate and display summary
     stats = generate_summary_stats(df)
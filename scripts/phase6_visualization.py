@@ -34,17 +34,38 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 import logging
+import gc
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from collections import Counter
 
 # Optional imports
 try:
+    import pyarrow  # noqa: F401 (enables the multithreaded CSV reader)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Plotting libraries are only located here; they are imported on first use
+# (see _get_plt) so table-only runs and library users skip their import cost
+HAS_PLOTTING = all(importlib.util.find_spec(m) is not None for m in ("matplotlib", "seaborn"))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_plt():
+    """Import matplotlib (non-interactive Agg backend) and seaborn once."""
     import matplotlib
     matplotlib.use('Agg')
     import matplotlib.pyplot as plt
     import seaborn as sns
-    HAS_PLOTTING = True
-except ImportError:
-    HAS_PLOTTING = False
+    return plt, sns
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -88,6 +109,88 @@ HOST_COLORS = {
     "Eukaryota_Protist": "#1abc9c"
 }
 
+# Columns read from the input tables; everything else is never touched
+NEEDED_COLS = [
+    "inferred_family", "family", "architecture_class", "genome_type",
+    "t_number", "structure_id", "evidence_level", "capsid_role"
+]
+
+# Threads used to render the figures concurrently
+PLOT_WORKERS = 4
+
+# Display order for T-number plots
+T_NUMBER_ORDER = ["T=1", "T=3", "pseudo-T=3", "T=7", "T=13", "pseudo-T=25", "higher", "NA"]
+
+# Low-cardinality string columns stored as pandas categoricals after loading
+CAT_COLS = [
+    "architecture_class", "genome_type", "t_number", "inferred_family",
+    "capsid_role", "evidence_level"
+]
+
+# Categorical columns scanned by several tables/plots; their per-column
+# statistics are computed once per run (see build_column_cache)
+CACHED_COLS = (
+    "architecture_class", "genome_type", "t_number", "inferred_family",
+    "capsid_role", "evidence_level", "structure_id"
+)
+
+
+def encode_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the CAT_COLS columns to categoricals in place.
+    
+    Categories are kept in order of first appearance so that value_counts()
+    breaks ties the same way it does for plain string columns.
+    
+    Args:
+        df: Loaded table
+    
+    Returns:
+        The same DataFrame
+    """
+    for col in CAT_COLS:
+        if col in df.columns:
+            df[col] = pd.Categorical(df[col], categories=df[col].dropna().unique())
+    
+    return df
+
+
+def _mode(series: pd.Series, default: str) -> str:
+    """Most frequent value, ties going to the lexically smallest (as for strings)."""
+    modes = series.mode()
+    return min(modes.tolist()) if len(modes) > 0 else default
+
+
+def read_table(csv_path: Path) -> pd.DataFrame:
+    """
+    Read the NEEDED_COLS present in a CSV, using PyArrow when installed.
+    
+    Args:
+        csv_path: Path to master, high-confidence or seed table
+    
+    Returns:
+        DataFrame with categorical CAT_COLS
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [c for c in header if c in NEEDED_COLS]
+    engine = "pyarrow" if HAS_PYARROW else "c"
+    return encode_categories(pd.read_csv(csv_path, usecols=usecols, engine=engine))
+
+
+def _join_first(series: pd.Series, n: int) -> str:
+    """Join the first n distinct non-null values in order of appearance."""
+    return ", ".join(list(dict.fromkeys(series.dropna().astype(str)))[:n])
+
+
+def _labels(values) -> pd.Series:
+    """Plain object Series of the given labels (e.g. a CategoricalIndex)."""
+    return pd.Series(np.asarray(values, dtype=object))
+
+
+def _colors(labels, table: Dict[str, str], default: str = "#95a5a6") -> np.ndarray:
+    """Look up one colour per label, falling back to `default` for unknown labels."""
+    return _labels(labels).map(table).fillna(default).to_numpy()
+
 
 def load_master_data() -> Optional[pd.DataFrame]:
     """Load the master capsidomics database."""
@@ -95,21 +198,21 @@ def load_master_data() -> Optional[pd.DataFrame]:
     # Try master table first
     master_path = DATA_CLEAN / "jrf_capsidomics_master.csv"
     if master_path.exists():
-        df = pd.read_csv(master_path)
+        df = read_table(master_path)
         logger.info(f"Loaded master table: {len(df)} entries")
         return df
     
     # Fall back to high confidence
     hc_path = DATA_CLEAN / "jrf_high_confidence.csv"
     if hc_path.exists():
-        df = pd.read_csv(hc_path)
+        df = read_table(hc_path)
         logger.info(f"Loaded high-confidence table: {len(df)} entries")
         return df
     
     # Fall back to seed set
     seed_path = DATA_RAW / "jrf_seed_set.csv"
     if seed_path.exists():
-        df = pd.read_csv(seed_path)
+        df = read_table(seed_path)
         logger.info(f"Loaded seed set: {len(df)} entries")
         return df
     
@@ -117,12 +220,77 @@ def load_master_data() -> Optional[pd.DataFrame]:
     return None
 
 
-def generate_family_overview_table(df: pd.DataFrame) -> pd.DataFrame:
+def column_stats(df: pd.DataFrame, col: str, col_cache: Optional[Dict] = None) -> Dict:
+    """
+    Get value counts, unique values and not-null mask for a column.
+    
+    Args:
+        df: Master database
+        col: Column name (must exist in df)
+        col_cache: Optional cache from build_column_cache; filled on a miss
+    
+    Returns:
+        Dictionary with "vc", "uniq" and "notna" entries
+    """
+    if col_cache is not None and col in col_cache:
+        return col_cache[col]
+    
+    series = df[col]
+    entry = {
+        "vc": series.value_counts(dropna=True),
+        "uniq": series.dropna().unique(),
+        "notna": series.notna()
+    }
+    if col_cache is not None:
+        col_cache[col] = entry
+    return entry
+
+
+def build_column_cache(df: pd.DataFrame) -> Dict[str, Dict]:
+    """
+    Compute column_stats once for every CACHED_COLS column present.
+    
+    Args:
+        df: Master database
+    
+    Returns:
+        Dictionary mapping column name to its column_stats entry
+    """
+    return {c: column_stats(df, c) for c in CACHED_COLS if c in df.columns}
+
+
+def resolve_cols(df: pd.DataFrame) -> Dict[str, Optional[str]]:
+    """
+    Resolve which optional columns to use for family and architecture.
+    
+    Args:
+        df: Master database
+    
+    Returns:
+        Dictionary with "family" and "arch" column names (None if absent)
+    """
+    columns = set(df.columns)
+    if "inferred_family" in columns:
+        family_col = "inferred_family"
+    elif "family" in columns:
+        family_col = "family"
+    else:
+        family_col = None
+    
+    return {
+        "family": family_col,
+        "arch": "architecture_class" if "architecture_class" in columns else None,
+    }
+
+
+def generate_family_overview_table(df: pd.DataFrame,
+                                   cols: Optional[Dict[str, Optional[str]]] = None) -> pd.DataFrame:
     """
     Generate a summary table of JRF virus families.
     
     Args:
         df: Master database
+        cols: Optional resolved columns from resolve_cols
     
     Returns:
         Summary DataFrame
@@ -130,33 +298,38 @@ def generate_family_overview_table(df: pd.DataFrame) -> pd.DataFrame:
     logger.info("Generating family overview table...")
     
     # Determine family column
-    family_col = "inferred_family" if "inferred_family" in df.columns else "family"
-    if family_col not in df.columns:
+    if cols is None:
+        cols = resolve_cols(df)
+    family_col = cols["family"]
+    if family_col is None:
         logger.warning("No family column found")
         return pd.DataFrame()
     
-    # Group by family
-    family_stats = []
+    # Group by family in a single pass (groups in order of first appearance)
+    families = df[family_col]
+    df = df[families.notna() & (families != "")]
+    g = df.groupby(family_col, observed=True, sort=False)
     
-    for family in df[family_col].dropna().unique():
-        if not family or family == "":
-            continue
-            
-        fam_df = df[df[family_col] == family]
-        
-        stats = {
-            "Family": family,
-            "Protein Count": len(fam_df),
-            "Architecture": fam_df["architecture_class"].mode()[0] if "architecture_class" in fam_df.columns and len(fam_df["architecture_class"].dropna()) > 0 else "Unknown",
-            "Genome Type": fam_df["genome_type"].mode()[0] if "genome_type" in fam_df.columns and len(fam_df["genome_type"].dropna()) > 0 else "Unknown",
-            "T-Number": fam_df["t_number"].mode()[0] if "t_number" in fam_df.columns and len(fam_df["t_number"].dropna()) > 0 else "Unknown",
-            "With Structure": len(fam_df[fam_df["structure_id"].notna() & (fam_df["structure_id"] != "")]) if "structure_id" in fam_df.columns else 0,
-            "High Confidence": len(fam_df[fam_df["evidence_level"] == "high"]) if "evidence_level" in fam_df.columns else 0
-        }
-        
-        family_stats.append(stats)
+    summary_df = pd.DataFrame({"Protein Count": g.size()})
+    
+    for label, col in (("Architecture", "architecture_class"),
+                       ("Genome Type", "genome_type"),
+                       ("T-Number", "t_number")):
+        summary_df[label] = g[col].agg(lambda s: _mode(s, "Unknown")) if col in df.columns else "Unknown"
+    
+    if "structure_id" in df.columns:
+        has_structure = df["structure_id"].notna() & (df["structure_id"] != "")
+        summary_df["With Structure"] = has_structure.groupby(df[family_col], observed=True, sort=False).sum()
+    else:
+        summary_df["With Structure"] = 0
     
-    summary_df = pd.DataFrame(family_stats)
+    if "evidence_level" in df.columns:
+        high_conf = df["evidence_level"] == "high"
+        summary_df["High Confidence"] = high_conf.groupby(df[family_col], observed=True, sort=False).sum()
+    else:
+        summary_df["High Confidence"] = 0
+    
+    summary_df = summary_df.rename_axis("Family").reset_index()
     summary_df = summary_df.sort_values("Protein Count", ascending=False)
     
     return summary_df
@@ -177,57 +350,79 @@ def generate_architecture_summary(df: pd.DataFrame) -> pd.DataFrame:
     if "architecture_class" not in df.columns:
         return pd.DataFrame()
     
-    arch_stats = []
+    # Group by architecture in a single pass (groups in order of first appearance)
+    archs = df["architecture_class"]
+    df = df[archs.notna() & (archs != "")]
+    g = df.groupby("architecture_class", observed=True, sort=False)
     
-    for arch in df["architecture_class"].dropna().unique():
-        if not arch or arch == "":
-            continue
-            
-        arch_df = df[df["architecture_class"] == arch]
-        
-        stats = {
-            "Architecture": arch,
-            "Total Proteins": len(arch_df),
-            "Families": len(arch_df["inferred_family"].dropna().unique()) if "inferred_family" in arch_df.columns else 0,
-            "Genome Types": ", ".join(arch_df["genome_type"].dropna().unique()[:3]) if "genome_type" in arch_df.columns else "",
-            "T-Numbers": ", ".join(arch_df["t_number"].dropna().unique()[:5]) if "t_number" in arch_df.columns else "",
-            "With Structure (%)": round(100 * len(arch_df[arch_df.get("structure_id", pd.Series()).notna()]) / len(arch_df), 1) if len(arch_df) > 0 else 0
-        }
-        
-        arch_stats.append(stats)
+    summary_df = pd.DataFrame({"Total Proteins": g.size()})
+    summary_df["Families"] = g["inferred_family"].nunique() if "inferred_family" in df.columns else 0
+    summary_df["Genome Types"] = g["genome_type"].agg(lambda s: _join_first(s, 3)) if "genome_type" in df.columns else ""
+    summary_df["T-Numbers"] = g["t_number"].agg(lambda s: _join_first(s, 5)) if "t_number" in df.columns else ""
     
-    summary_df = pd.DataFrame(arch_stats)
+    if "structure_id" in df.columns:
+        has_structure = df["structure_id"].notna().groupby(df["architecture_class"], observed=True, sort=False).sum()
+        summary_df["With Structure (%)"] = (100 * has_structure / summary_df["Total Proteins"]).round(1)
+    else:
+        summary_df["With Structure (%)"] = 0.0
+    
+    summary_df = summary_df.rename_axis("Architecture").reset_index()
     summary_df = summary_df.sort_values("Total Proteins", ascending=False)
     
     return summary_df
 
 
-def generate_genome_architecture_matrix(df: pd.DataFrame) -> pd.DataFrame:
+def generate_genome_architecture_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Count proteins per genome type and architecture (no margins).
+    
+    Args:
+        df: Master database
+    
+    Returns:
+        Cross-tabulation DataFrame with sorted labels
+    """
+    if "genome_type" not in df.columns or "architecture_class" not in df.columns:
+        return pd.DataFrame()
+    
+    counts = (
+        df.groupby(["genome_type", "architecture_class"], observed=True)
+        .size()
+        .unstack(fill_value=0)
+    )
+    
+    # Categorical groups come out in category order; keep labels sorted
+    return counts.reindex(index=sorted(counts.index), columns=sorted(counts.columns))
+
+
+def generate_genome_architecture_matrix(df: pd.DataFrame,
+                                        counts: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Generate a cross-tabulation of genome types vs architectures.
     
     Args:
         df: Master database
+        counts: Precomputed generate_genome_architecture_counts result
     
     Returns:
-        Cross-tabulation DataFrame
+        Cross-tabulation DataFrame with "Total" margins
     """
     logger.info("Generating genome x architecture matrix...")
     
-    if "genome_type" not in df.columns or "architecture_class" not in df.columns:
+    if counts is None:
+        counts = generate_genome_architecture_counts(df)
+    if counts.empty:
         return pd.DataFrame()
     
-    matrix = pd.crosstab(
-        df["genome_type"],
-        df["architecture_class"],
-        margins=True,
-        margins_name="Total"
-    )
+    matrix = counts.copy()
+    matrix["Total"] = counts.sum(axis=1)
+    matrix.loc["Total"] = matrix.sum(axis=0)
     
     return matrix
 
 
-def plot_architecture_distribution(df: pd.DataFrame, output_path: Path):
+def plot_architecture_distribution(df: pd.DataFrame, output_path: Path,
+                                   col_cache: Optional[Dict] = None):
     """
     Create a pie chart of architecture class distribution.
     """
@@ -236,10 +431,14 @@ def plot_architecture_distribution(df: pd.DataFrame, output_path: Path):
     
     logger.info("Creating architecture distribution plot...")
     
-    counts = df["architecture_class"].value_counts()
-    colors = [ARCHITECTURE_COLORS.get(a, "#95a5a6") for a in counts.index]
+    counts = column_stats(df, "architecture_class", col_cache)["vc"]
+    colors = _colors(counts.index, ARCHITECTURE_COLORS)
     
-    fig, ax = plt.subplots(figsize=(10, 8))
+    plt, _ = _get_plt()
+    
+    # Figures are created outside pyplot so nothing lingers in its registry
+    fig = plt.Figure(figsize=(10, 8), layout="constrained")
+    ax = fig.add_subplot(111)
     
     wedges, texts, autotexts = ax.pie(
         counts.values,
@@ -256,14 +455,13 @@ def plot_architecture_distribution(df: pd.DataFrame, output_path: Path):
     legend_labels = [f"{arch}: {count}" for arch, count in zip(counts.index, counts.values)]
     ax.legend(wedges, legend_labels, title="Count", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1))
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
     
     logger.info(f"  Saved: {output_path}")
 
 
-def plot_genome_type_distribution(df: pd.DataFrame, output_path: Path):
+def plot_genome_type_distribution(df: pd.DataFrame, output_path: Path,
+                                  col_cache: Optional[Dict] = None):
     """
     Create a bar chart of genome type distribution.
     """
@@ -272,10 +470,14 @@ def plot_genome_type_distribution(df: pd.DataFrame, output_path: Path):
     
     logger.info("Creating genome type distribution plot...")
     
-    counts = df["genome_type"].value_counts()
-    colors = [GENOME_COLORS.get(g, "#95a5a6") for g in counts.index]
+    counts = column_stats(df, "genome_type", col_cache)["vc"]
+    colors = _colors(counts.index, GENOME_COLORS)
+    
+    plt, _ = _get_plt()
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Figures are created outside pyplot so nothing lingers in its registry
+    fig = plt.Figure(figsize=(10, 6), layout="constrained")
+    ax = fig.add_subplot(111)
     
     bars = ax.bar(counts.index, counts.values, color=colors, edgecolor='black', linewidth=0.5)
     
@@ -284,19 +486,17 @@ def plot_genome_type_distribution(df: pd.DataFrame, output_path: Path):
     ax.set_title("JRF Proteins by Genome Type", fontsize=14, fontweight='bold')
     
     # Add value labels on bars
-    for bar, count in zip(bars, counts.values):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
-                str(count), ha='center', va='bottom', fontsize=10)
+    ax.bar_label(bars, padding=3, fontsize=10)
     
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    ax.tick_params(axis='x', labelrotation=45)
+    plt.setp(ax.get_xticklabels(), ha='right')
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
     
     logger.info(f"  Saved: {output_path}")
 
 
-def plot_t_number_distribution(df: pd.DataFrame, output_path: Path):
+def plot_t_number_distribution(df: pd.DataFrame, output_path: Path,
+                               col_cache: Optional[Dict] = None):
     """
     Create a bar chart of T-number distribution.
     """
@@ -305,20 +505,19 @@ def plot_t_number_distribution(df: pd.DataFrame, output_path: Path):
     
     logger.info("Creating T-number distribution plot...")
     
-    # Order T-numbers logically
-    t_order = ["T=1", "T=3", "pseudo-T=3", "T=7", "T=13", "pseudo-T=25", "higher", "NA"]
+    counts = column_stats(df, "t_number", col_cache)["vc"]
     
-    counts = df["t_number"].value_counts()
-    # Reorder
-    ordered_counts = pd.Series(dtype=int)
-    for t in t_order:
-        if t in counts.index:
-            ordered_counts[t] = counts[t]
-    for t in counts.index:
-        if t not in ordered_counts.index:
-            ordered_counts[t] = counts[t]
+    # Order T-numbers logically, unlisted values after in count order
+    present = set(counts.index)
+    order = [t for t in T_NUMBER_ORDER if t in present]
+    order += [t for t in counts.index if t not in T_NUMBER_ORDER]
+    ordered_counts = counts.reindex(order)
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    plt, _ = _get_plt()
+    
+    # Figures are created outside pyplot so nothing lingers in its registry
+    fig = plt.Figure(figsize=(12, 6), layout="constrained")
+    ax = fig.add_subplot(111)
     
     colors = plt.cm.viridis(np.linspace(0, 0.8, len(ordered_counts)))
     bars = ax.bar(ordered_counts.index, ordered_counts.values, color=colors, edgecolor='black', linewidth=0.5)
@@ -327,21 +526,24 @@ def plot_t_number_distribution(df: pd.DataFrame, output_path: Path):
     ax.set_ylabel("Number of Proteins", fontsize=12)
     ax.set_title("JRF Capsid Proteins by Triangulation Number", fontsize=14, fontweight='bold')
     
-    for bar, count in zip(bars, ordered_counts.values):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.3,
-                str(count), ha='center', va='bottom', fontsize=9)
+    ax.bar_label(bars, padding=3, fontsize=9)
     
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    ax.tick_params(axis='x', labelrotation=45)
+    plt.setp(ax.get_xticklabels(), ha='right')
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
     
     logger.info(f"  Saved: {output_path}")
 
 
-def plot_genome_architecture_heatmap(df: pd.DataFrame, output_path: Path):
+def plot_genome_architecture_heatmap(df: pd.DataFrame, output_path: Path,
+                                     matrix: Optional[pd.DataFrame] = None):
     """
     Create a heatmap of genome type vs architecture class.
+    
+    Args:
+        df: Master database
+        output_path: Path to save the figure
+        matrix: Precomputed generate_genome_architecture_counts result
     """
     if not HAS_PLOTTING:
         return
@@ -351,9 +553,16 @@ def plot_genome_architecture_heatmap(df: pd.DataFrame, output_path: Path):
     
     logger.info("Creating genome x architecture heatmap...")
     
-    matrix = pd.crosstab(df["genome_type"], df["architecture_class"])
+    if matrix is None:
+        matrix = generate_genome_architecture_counts(df)
+    if matrix.empty:
+        return
+    
+    plt, sns = _get_plt()
     
-    fig, ax = plt.subplots(figsize=(10, 8))
+    # Figures are created outside pyplot so nothing lingers in its registry
+    fig = plt.Figure(figsize=(10, 8), layout="constrained")
+    ax = fig.add_subplot(111)
     
     sns.heatmap(matrix, 
                 annot=True, 
@@ -366,44 +575,47 @@ def plot_genome_architecture_heatmap(df: pd.DataFrame, output_path: Path):
     ax.set_ylabel("Genome Type", fontsize=12)
     ax.set_title("JRF Proteins: Genome Type vs Architecture", fontsize=14, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
     
     logger.info(f"  Saved: {output_path}")
 
 
-def plot_family_overview(df: pd.DataFrame, output_path: Path, top_n: int = 15):
+def plot_family_overview(df: pd.DataFrame, output_path: Path, top_n: int = 15,
+                         col_cache: Optional[Dict] = None,
+                         cols: Optional[Dict[str, Optional[str]]] = None):
     """
     Create a horizontal bar chart of top families.
     """
     if not HAS_PLOTTING:
         return
     
-    family_col = "inferred_family" if "inferred_family" in df.columns else "family"
-    if family_col not in df.columns:
+    if cols is None:
+        cols = resolve_cols(df)
+    family_col = cols["family"]
+    if family_col is None:
         return
     
     logger.info("Creating family overview plot...")
     
-    counts = df[family_col].value_counts().head(top_n)
+    counts = column_stats(df, family_col, col_cache)["vc"].head(top_n)
     
-    # Get architecture for color coding
+    # Get architecture for color coding: one grouped pass over the plotted families
     family_arch = {}
-    for fam in counts.index:
-        fam_df = df[df[family_col] == fam]
-        if "architecture_class" in fam_df.columns and len(fam_df) > 0:
-            mode = fam_df["architecture_class"].mode()
-            if len(mode) > 0:
-                family_arch[fam] = mode[0]
-            else:
-                family_arch[fam] = "other"
-        else:
-            family_arch[fam] = "other"
+    if cols["arch"] is not None:
+        top_df = df[df[family_col].isin(counts.index)]
+        family_arch = (
+            top_df.groupby(family_col, observed=True)[cols["arch"]]
+            .agg(lambda s: _mode(s, "other"))
+            .to_dict()
+        )
     
-    colors = [ARCHITECTURE_COLORS.get(family_arch.get(f, "other"), "#95a5a6") for f in counts.index]
+    colors = _colors(_labels(counts.index).map(family_arch).fillna("other"), ARCHITECTURE_COLORS)
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    plt, _ = _get_plt()
+    
+    # Figures are created outside pyplot so nothing lingers in its registry
+    fig = plt.Figure(figsize=(12, 8), layout="constrained")
+    ax = fig.add_subplot(111)
     
     y_pos = range(len(counts))
     bars = ax.barh(y_pos, counts.values, color=colors, edgecolor='black', linewidth=0.5)
@@ -417,30 +629,20 @@ def plot_family_overview(df: pd.DataFrame, output_path: Path, top_n: int = 15):
     ax.set_title(f"Top {top_n} JRF-Containing Virus Families", fontsize=14, fontweight='bold')
     
     # Add value labels
-    for bar, count in zip(bars, counts.values):
-        ax.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2,
-                str(count), ha='left', va='center', fontsize=9)
+    ax.bar_label(bars, padding=3, fontsize=9)
     
     # Add legend for architectures
     from matplotlib.patches import Patch
     legend_elements = [Patch(facecolor=color, label=arch) for arch, color in ARCHITECTURE_COLORS.items()]
     ax.legend(handles=legend_elements, title="Architecture", loc='lower right')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
     
     logger.info(f"  Saved: {output_path}")
 
 
-def create_evolutionary_schematic_text() -> str:
-    """
-    Generate a text-based evolutionary schematic.
-    
-    Returns:
-        ASCII art schematic
-    """
-    schematic = """
+# Text-based evolutionary schematic (UTF-8 box drawing), written verbatim
+SCHEMATIC_BYTES = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    JRF EVOLUTIONARY LINEAGE SCHEMATIC                         ║
 ╠══════════════════════════════════════════════════════════════════════════════╣
@@ -489,32 +691,76 @@ def create_evolutionary_schematic_text() -> str:
 ║     • DJR lineage shows vertical inheritance: Bacteria → Archaea → Eukarya  ║
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
-"""
-    return schematic
+""".encode("utf-8")
 
 
-def generate_summary_statistics(df: pd.DataFrame) -> Dict:
+def generate_summary_statistics(df: pd.DataFrame, col_cache: Optional[Dict] = None,
+                                cols: Optional[Dict[str, Optional[str]]] = None) -> Dict:
     """
     Generate comprehensive summary statistics.
+    
+    Args:
+        df: Master database
+        col_cache: Optional per-column statistics from build_column_cache
+        cols: Optional resolved columns from resolve_cols
+    
+    Returns:
+        Statistics dictionary
     """
     logger.info("Generating summary statistics...")
     
+    if col_cache is None:
+        col_cache = build_column_cache(df)
+    if cols is None:
+        cols = resolve_cols(df)
+    
+    def distribution(col: str) -> Dict:
+        # Plain str/int pairs so either JSON backend serializes them directly
+        if col not in col_cache:
+            return {}
+        return {str(k): int(v) for k, v in col_cache[col]["vc"].items()}
+    
+    # Architecture counts also give the SJR/DJR totals
+    arch_counts = column_stats(df, cols["arch"], col_cache)["vc"] if cols["arch"] is not None else pd.Series(dtype=int)
+    
     stats = {
         "total_entries": len(df),
-        "unique_families": len(df["inferred_family"].dropna().unique()) if "inferred_family" in df.columns else 0,
-        "architecture_distribution": df["architecture_class"].value_counts().to_dict() if "architecture_class" in df.columns else {},
-        "genome_type_distribution": df["genome_type"].value_counts().to_dict() if "genome_type" in df.columns else {},
-        "t_number_distribution": df["t_number"].value_counts().to_dict() if "t_number" in df.columns else {},
-        "capsid_role_distribution": df["capsid_role"].value_counts().to_dict() if "capsid_role" in df.columns else {},
-        "evidence_level_distribution": df["evidence_level"].value_counts().to_dict() if "evidence_level" in df.columns else {},
-        "with_structure": len(df[df["structure_id"].notna() & (df["structure_id"] != "")]) if "structure_id" in df.columns else 0,
-        "sjr_count": len(df[df["architecture_class"] == "SJR"]) if "architecture_class" in df.columns else 0,
-        "djr_count": len(df[df["architecture_class"] == "DJR"]) if "architecture_class" in df.columns else 0,
+        "unique_families": len(col_cache["inferred_family"]["uniq"]) if "inferred_family" in col_cache else 0,
+        "architecture_distribution": distribution("architecture_class"),
+        "genome_type_distribution": distribution("genome_type"),
+        "t_number_distribution": distribution("t_number"),
+        "capsid_role_distribution": distribution("capsid_role"),
+        "evidence_level_distribution": distribution("evidence_level"),
+        "with_structure": int((col_cache["structure_id"]["notna"] & df["structure_id"].ne("")).sum()) if "structure_id" in col_cache else 0,
+        "sjr_count": int(arch_counts.get("SJR", 0)),
+        "djr_count": int(arch_counts.get("DJR", 0)),
     }
     
     return stats
 
 
+def write_json(obj: Dict, output_path: Path):
+    """
+    Write a dictionary as 2-space indented JSON.
+    
+    Uses orjson when available; its output matches json.dump(indent=2) byte
+    for byte except that it does not escape non-ASCII, so those (rare) cases
+    go through the standard library instead.
+    
+    Args:
+        obj: JSON-serializable dictionary
+        output_path: Destination file
+    """
+    if HAS_ORJSON:
+        blob = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        if blob.isascii():
+            output_path.write_bytes(blob)
+            return
+    
+    with open(output_path, "w") as f:
+        json.dump(obj, f, indent=2)
+
+
 def main():
     """Main execution function."""
     
@@ -527,11 +773,15 @@ def main():
     if df is None:
         return
     
+    # Column statistics shared by the figures and summary statistics
+    col_cache = build_column_cache(df)
+    cols = resolve_cols(df)
+    
     # Step 2: Generate summary tables
     logger.info("\nStep 2: Generating summary tables...")
     
     # Family overview
-    family_table = generate_family_overview_table(df)
+    family_table = generate_family_overview_table(df, cols)
     if not family_table.empty:
         family_path = ANALYSES / "summary_family_overview.csv"
         family_table.to_csv(family_path, index=False)
@@ -544,8 +794,9 @@ def main():
         arch_table.to_csv(arch_path, index=False)
         logger.info(f"  Saved: {arch_path}")
     
-    # Genome x Architecture matrix
-    matrix = generate_genome_architecture_matrix(df)
+    # Genome x Architecture matrix (counts shared with the heatmap)
+    counts = generate_genome_architecture_counts(df)
+    matrix = generate_genome_architecture_matrix(df, counts)
     if not matrix.empty:
         matrix_path = ANALYSES / "genome_architecture_matrix.csv"
         matrix.to_csv(matrix_path)
@@ -555,37 +806,41 @@ def main():
     logger.info("\nStep 3: Generating figures...")
     
     if HAS_PLOTTING:
-        # Architecture distribution
-        plot_architecture_distribution(df, FIGURES / "architecture_distribution.png")
-        
-        # Genome type distribution
-        plot_genome_type_distribution(df, FIGURES / "genome_type_distribution.png")
-        
-        # T-number distribution
-        plot_t_number_distribution(df, FIGURES / "t_number_distribution.png")
-        
-        # Genome x Architecture heatmap
-        plot_genome_architecture_heatmap(df, FIGURES / "genome_architecture_heatmap.png")
+        # Import the plotting stack once up front, then render the independent
+        # figures concurrently (each on its own Figure, no shared pyplot state)
+        _get_plt()
+        with ThreadPoolExecutor(max_workers=PLOT_WORKERS) as pool:
+            futures = [
+                # Architecture distribution
+                pool.submit(plot_architecture_distribution, df, FIGURES / "architecture_distribution.png", col_cache),
+                # Genome type distribution
+                pool.submit(plot_genome_type_distribution, df, FIGURES / "genome_type_distribution.png", col_cache),
+                # T-number distribution
+                pool.submit(plot_t_number_distribution, df, FIGURES / "t_number_distribution.png", col_cache),
+                # Genome x Architecture heatmap
+                pool.submit(plot_genome_architecture_heatmap, df, FIGURES / "genome_architecture_heatmap.png", counts),
+                # Family overview
+                pool.submit(plot_family_overview, df, FIGURES / "family_overview.png", col_cache=col_cache, cols=cols),
+            ]
+            for future in futures:
+                future.result()
         
-        # Family overview
-        plot_family_overview(df, FIGURES / "family_overview.png")
+        # Drop the rendered figures before the remaining steps
+        gc.collect()
     else:
         logger.warning("Matplotlib not available. Skipping figure generation.")
     
     # Step 4: Generate evolutionary schematic
     logger.info("\nStep 4: Generating evolutionary schematic...")
-    schematic = create_evolutionary_schematic_text()
     schematic_path = FIGURES / "evolutionary_schematic.txt"
-    with open(schematic_path, "w") as f:
-        f.write(schematic)
+    schematic_path.write_bytes(SCHEMATIC_BYTES)
     logger.info(f"  Saved: {schematic_path}")
     
     # Step 5: Generate summary statistics
     logger.info("\nStep 5: Generating summary statistics...")
-    stats = generate_summary_statistics(df)
+    stats = generate_summary_statistics(df, col_cache, cols)
     stats_path = ANALYSES / "final_summary_statistics.json"
-    with open(stats_path, "w") as f:
-        json.dump(stats, f, indent=2)
+    write_json(stats, stats_path)
     logger.info(f"  Saved: {stats_path}")
     
     # Display summary
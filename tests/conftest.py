@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The phase scripts are run directly, not installed; make them importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,97 @@
+"""Tests for the Phase 4 annotation step."""
+
+import pandas as pd
+import pytest
+
+import phase4_annotation as p4
+
+
+OUTPUTS = [
+    "jrf_capsidomics_master.csv",
+    "jrf_high_confidence.csv",
+    "jrf_capsidomics_summary.json",
+]
+
+# Blank and NA cells in the integer columns, plus a float column that pandas
+# writes in exponent form (outside 1e-9 <= |x| < 1e-4, where Polars differs)
+HITS_BLANK_NUMERIC = """\
+uniprot_id,protein_name,organism,taxonomy_id,protein_length,pfam_source,pfam_jrf_class,pfam_capsid_role,family,is_virus,evalue,evidence_level,source
+P03135,Capsid protein VP1,Adeno-associated virus 2,10804,735,PF00740,SJR,MCP,Parvoviridae,True,1e-12,high,simulated_demo
+A0A0B4J2A1,Capsid protein,Adeno-associated virus 5,68476,,PF00740,SJR,MCP,Parvoviridae,True,0.5,high,simulated_demo
+P12345,Major capsid protein,Enterobacteria phage PRD1,,394,PF09018,DJR,MCP,Tectiviridae,True,2.5e-30,medium,simulated_demo
+Q98765,Coat protein,Tobacco mosaic virus,12242,NA,PF00721,other,MCP,Virgaviridae,True,3,low,simulated_demo
+"""
+
+# Blank family and PFAM cells
+HITS_BLANK_TEXT = """\
+uniprot_id,protein_name,organism,taxonomy_id,protein_length,pfam_source,pfam_jrf_class,pfam_capsid_role,family,is_virus,evidence_level,source
+P03135,Capsid protein VP1,Adeno-associated virus 2,10804,735,PF00740,SJR,MCP,,True,high,simulated_demo
+P12345,Major capsid protein,Enterobacteria phage PRD1,10658,394,PF09018,,,Tectiviridae,True,medium,simulated_demo
+Q11111,Hypothetical protein,Unclassified virus,99999,410,PF00000,,,,True,low,simulated_demo
+Q22222,Coat protein,Unclassified virus,99998,520,PF00000,SJR,,Unknownviridae,True,low,simulated_demo
+"""
+
+
+def run_phase4(tmp_path, monkeypatch, hits_csv, use_polars):
+    """Run main() on hits_csv in a scratch data_clean dir; return output bytes."""
+    out_dir = tmp_path / ("polars" if use_polars else "pandas")
+    out_dir.mkdir()
+    (out_dir / "jrf_all_hits_clean.csv").write_text(hits_csv)
+    
+    monkeypatch.setattr(p4, "DATA_CLEAN", out_dir)
+    monkeypatch.setattr(p4, "HAS_POLARS", use_polars)
+    p4.main()
+    
+    return {name: (out_dir / name).read_bytes() for name in OUTPUTS}
+
+
+def test_polars_path_matches_pandas_with_blank_numeric_cells(tmp_path, monkeypatch):
+    pytest.importorskip("polars")
+    
+    pandas_out = run_phase4(tmp_path, monkeypatch, HITS_BLANK_NUMERIC, use_polars=False)
+    polars_out = run_phase4(tmp_path, monkeypatch, HITS_BLANK_NUMERIC, use_polars=True)
+    
+    assert b",735.0," in pandas_out["jrf_capsidomics_master.csv"]
+    assert b",1e-12\n" in pandas_out["jrf_capsidomics_master.csv"]
+    for name in OUTPUTS:
+        assert polars_out[name] == pandas_out[name], name
+
+
+def test_polars_path_matches_pandas_with_blank_text_cells(tmp_path, monkeypatch):
+    pytest.importorskip("polars")
+    
+    pandas_out = run_phase4(tmp_path, monkeypatch, HITS_BLANK_TEXT, use_polars=False)
+    polars_out = run_phase4(tmp_path, monkeypatch, HITS_BLANK_TEXT, use_polars=True)
+    
+    for name in OUTPUTS:
+        assert polars_out[name] == pandas_out[name], name
+
+
+@pytest.mark.parametrize("use_polars", [False, True])
+def test_blank_family_and_pfam_cells_are_inferred(tmp_path, monkeypatch, use_polars):
+    if use_polars:
+        pytest.importorskip("polars")
+    
+    run_phase4(tmp_path, monkeypatch, HITS_BLANK_TEXT, use_polars)
+    out_dir = tmp_path / ("polars" if use_polars else "pandas")
+    master = pd.read_csv(out_dir / "jrf_capsidomics_master.csv", keep_default_na=False)
+    master = master.set_index("uniprot_id")
+    
+    # Blank family: inferred from the organism name
+    assert master.at["P03135", "inferred_family"] == "Parvoviridae"
+    assert master.at["P03135", "t_number"] == "pseudo-T=3"
+    # Blank family and PFAM role: role inferred from the protein name
+    assert master.at["Q11111", "capsid_role"] == "unknown"
+    assert master.at["Q22222", "capsid_role"] == "MCP"
+
+
+def test_category_counts_keep_first_appearance_order_for_ties():
+    df = pd.DataFrame({"inferred_family": ["Tectiviridae", "Adenoviridae", "Tectiviridae",
+                                           "Bromoviridae", "Adenoviridae", "Asfarviridae"]})
+    p4.encode_categories(df, ["inferred_family"])
+    
+    counts = p4._category_counts(df, "inferred_family")
+    
+    assert list(counts.items()) == [
+        ("Tectiviridae", 2), ("Adenoviridae", 2), ("Bromoviridae", 1), ("Asfarviridae", 1),
+    ]